@@ -1,5 +1,6 @@
 import random
-from src.hierarchy import Hierarchy
+from typing import Optional
+from src.hierarchy import Hierarchy, calculate_waves
 from src.models import (
     ColumnDefinition,
     ColumnProfileDefinition,
@@ -9,7 +10,6 @@ from src.models import (
     TableProfileDefinition,
 )
 from src.logging_config import get_logger
-from src.producers.options_producer import OptionsProducer
 from src.producers.producer_factory import ProducerFactory
 from src.utils import bcolors
 
@@ -17,8 +17,10 @@ logger = get_logger()
 
 
 class Generator:
-    def __init__(self):
-        self.producer_factory = ProducerFactory()
+    def __init__(self, seed: Optional[int] = None):
+        self.producer_factory = ProducerFactory(seed=seed)
+        # Picks the dependency rows every FK column reads from
+        self._rng = random.Random(seed)
 
     def get_producer(
         self,
@@ -44,7 +46,7 @@ class Generator:
         # logger.info(f"Generating data for table: {table_definition.name}")
 
         if profile_configuration.options:
-            producer = OptionsProducer()
+            producer = self.producer_factory.get_options_producer(table_definition)
             return producer.generate(
                 table_definition, profile_configuration, None, None, context=context
             )
@@ -109,22 +111,7 @@ class Generator:
 
         context = {"__tables__": {}, "__satisfied_dependencies__": [], "__state__": {}}
 
-        def generate():
-            # get all the tables that have no dependencies or dependencies that have already been satisfied
-            tables_to_generate = [
-                table
-                for table in hierarchy
-                if (
-                    table not in context["__satisfied_dependencies__"]
-                    and (
-                        len(hierarchy[table]["depends_on"]) == 0
-                        or all(
-                            dependency in context["__satisfied_dependencies__"]
-                            for dependency in hierarchy[table]["depends_on"]
-                        )
-                    )
-                )
-            ]
+        def generate(tables_to_generate: list):
             tables = context["__tables__"]
             for table_name in tables_to_generate:
                 table_definition, table_profile_configuration = (
@@ -149,8 +136,9 @@ class Generator:
                         logger.info(
                             f"Preparing dependency: {dependency} for table: {table_name}"
                         )
-                        print(tables)
-                        context[dependency] = random.choice(tables[dependency])
+                        # lazy args: the tables are only rendered when DEBUG is enabled
+                        logger.debug("Tables: %s", tables)
+                        context[dependency] = self._rng.choice(tables[dependency])
                         logger.info(
                             f"Prepared dependency: {dependency} for table: {table_name}"
                         )
@@ -179,8 +167,11 @@ class Generator:
                 ]
                 context["__satisfied_dependencies__"].append(table_name)
 
-        while len(context["__satisfied_dependencies__"]) < len(hierarchy):
-            generate()
+        # each wave only depends on tables generated in the previous waves
+        for tables_to_generate in calculate_waves(
+            hierarchy, context["__satisfied_dependencies__"]
+        ):
+            generate(tables_to_generate)
             logger.info(
                 f"Satisfied dependencies: {context['__satisfied_dependencies__']}"
             )
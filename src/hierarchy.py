@@ -104,3 +104,53 @@ class Hierarchy:
             ref_table["depends_on"].append(foreign_table)
 
         return hierarchy
+
+
+def calculate_waves(hierarchy: dict, satisfied: list = None) -> list:
+    """
+    Group the tables of a processed hierarchy into waves using Kahn's algorithm.
+
+    Every table in a wave only depends on tables from earlier waves or on the
+    already satisfied ones, so the tables of a wave can be processed together.
+
+    Args:
+        hierarchy: Output of Hierarchy.process_hierarchy
+        satisfied: Tables that are already available (e.g. static tables)
+
+    Returns:
+        List of waves, each a list of table names in hierarchy order
+    """
+    satisfied = set(satisfied or [])
+    order = {table: index for index, table in enumerate(hierarchy)}
+
+    indegree = {}
+    dependents = {}
+    for table, table_obj in hierarchy.items():
+        if table in satisfied:
+            continue
+        pending = [
+            dependency
+            for dependency in table_obj["depends_on"]
+            if dependency not in satisfied
+        ]
+        indegree[table] = len(pending)
+        for dependency in pending:
+            dependents.setdefault(dependency, []).append(table)
+
+    waves = []
+    wave = [table for table, degree in indegree.items() if degree == 0]
+    while wave:
+        waves.append(wave)
+        next_wave = []
+        for table in wave:
+            for dependent in dependents.get(table, []):
+                indegree[dependent] -= 1
+                if indegree[dependent] == 0:
+                    next_wave.append(dependent)
+        wave = sorted(next_wave, key=order.get)
+
+    unresolved = [table for table, degree in indegree.items() if degree > 0]
+    if unresolved:
+        raise ValueError(f"Unable to resolve table dependencies for: {unresolved}")
+
+    return waves
@@ -6,6 +6,7 @@ from binascii import crc32
 import os
 import json
 import logging
+import threading
 from typing import Optional, Dict, List, Any
 from enum import Enum
 from dotenv import load_dotenv
@@ -27,6 +28,11 @@ class LLMProvider(Enum):
 
 CACHE_FILE = "llm_cache.json"
 
+# How long Ollama keeps the local model loaded after a call. Ollama's own
+# default (5m) lets the weights be evicted between profiling and generation,
+# and every reload pays the full model load again.
+OLLAMA_KEEP_ALIVE = os.getenv("OLLAMA_KEEP_ALIVE", "30m")
+
 
 class LLMCaller:
     """
@@ -48,6 +54,8 @@ class LLMCaller:
         self.preferred_provider = preferred_provider
         self._setup_providers()
 
+        # Guards the response cache when calls are issued from several threads
+        self._cache_lock = threading.Lock()
         self._load_cache()
 
     def get_key_data(self, payload: dict) -> str:
@@ -60,8 +68,12 @@ class LLMCaller:
         return str(crc_hash)
 
     def _save_cache(self):
-        with open(CACHE_FILE, "w") as f:
+        # Write to a temporary file and swap it in, so an interrupted run never
+        # leaves a truncated cache behind (which _load_cache would discard whole)
+        tmp_file = f"{CACHE_FILE}.tmp"
+        with open(tmp_file, "w") as f:
             json.dump(self.cache, f, indent=4)
+        os.replace(tmp_file, CACHE_FILE)
 
     def _load_cache(self):
         try:
@@ -82,8 +94,9 @@ class LLMCaller:
 
     def _set_cache(self, payload: Any, value: str):
         key = self.get_key_data(payload)
-        self.cache[key] = value
-        self._save_cache()
+        with self._cache_lock:
+            self.cache[key] = value
+            self._save_cache()
 
     def _setup_providers(self):
         """Setup and validate available providers."""
@@ -104,6 +117,23 @@ class LLMCaller:
 
             self.available_local_models = models
 
+            # OLLAMA_MODEL pins a specific tag, e.g. a 4-bit quantized build
+            # (qwen2.5:3b-instruct-q4_K_M) which moves a quarter of the weight
+            # bytes per decoded token compared to fp16.
+            preferred_model = os.getenv("OLLAMA_MODEL")
+            self.local_model = next(
+                (m for m in models if m.model == preferred_model),
+                models[0] if models else None,
+            )
+            if (
+                preferred_model
+                and self.local_model
+                and self.local_model.model != preferred_model
+            ):
+                logger.warning(
+                    f"Local model {preferred_model} not found, using {self.local_model.model}"
+                )
+
             logger.info(
                 f"Local mode enabled. Available models: {[m.model for m in self.available_local_models]}"
             )
@@ -174,8 +204,8 @@ class LLMCaller:
         )
 
     def _select_local_model(self) -> LLMProvider:
-        """Select a local model (default to Qwen 2.5)."""
-        return self.available_local_models[0]
+        """Select a local model (OLLAMA_MODEL if available, else the first one)."""
+        return self.local_model
 
     def _select_cloud_provider(self) -> LLMProvider:
         """Select a cloud provider based on preference or availability."""
@@ -270,6 +300,7 @@ class LLMCaller:
                     "num_predict": max_tokens,
                     **kwargs,
                 },
+                keep_alive=OLLAMA_KEEP_ALIVE,
             )
             return response["message"]["content"]
         except Exception as e:
@@ -1,3 +1,6 @@
+import json
+
+
 def heal_dynamic_response_table(response: str):
     SYSTEM_PROMPT = """
   You are an expert text processing utility. Your sole task is to extract a single, valid JSON object from the provided input string.
@@ -199,56 +202,41 @@ Return ONLY valid JSON. No markdown formatting.
     return SYSTEM_PROMPT, PROMPT
 
 
-def get_configuration_for_column(generating_prompt: str, model_schema_json: str):
-    SYSTEM_PROMPT = """You are an expert data engineer. Your task is to generate a configuration object based on the generating prompt and json schema
+def get_configuration_for_columns(columns_info: dict, model_schema_json: str):
+    SYSTEM_PROMPT = """You are an expert data engineer. Your task is to generate one configuration object per column based on each column's generating prompt and a shared json schema
 
 ### INPUT
 You will receive the following information as input;
-1. `Generating Prompt`: the guide to configure the configuration
-2. `Model JSON Schema`: the schema for the configuration object
+1. `Generating prompts`: a JSON object mapping each column name to the guide used to configure that column
+2. `Model JSON Schema`: the schema every configuration object must follow
 
-### Ouput
-1. When generating the prompt stick **ONLY** to the properties that are described in the schema and **DO NOT** generate others
-2. **DO NOT** return back the schema with values and return only the configuration object containing the properties and values
-3. Output **ONLY** the configuration object JSON in the nested in the ```json ```
+### Output
+1. When generating a configuration stick **ONLY** to the properties that are described in the schema and **DO NOT** generate others
+2. **DO NOT** return back the schema with values
+3. Return a JSON object whose keys are **exactly** the column names from the input and whose values are the configuration objects
+4. Output **ONLY** that JSON object nested in the ```json ```
 
 ### Example
 
-**Input:**
+**Generating prompts:**
 {
-    "description": "Model for numeric type.",
-    "properties": {
-        "precision": {
-            "description": "The precision of the numeric type",
-            "title": "Precision",
-            "type": "integer"
-        },
-        "max_value": {
-            "default": 10,
-            "description": "The max value of the numeric type",
-            "title": "Max Value",
-            "type": "number"
-        },
-        "min_value": {
-            "default": 1,
-            "description": "The min value of the numeric type",
-            "title": "Min Value",
-            "type": "number"
-        }
-    },
-    "required": [
-        "precision"
-    ],
-    "title": "NumericType",
-    "type": "object"
+    "age": "Generate a random integer between 18 and 100",
+    "price": "Generate a positive decimal with 2 precision with values between 1.00 and 100.00"
 }
 
 **Output:**
 ```json
 {
-    "precision": 2,
-    "min_value": 10,
-    "max_value": 1000
+    "age": {
+        "precision": 0,
+        "min_value": 18,
+        "max_value": 100
+    },
+    "price": {
+        "precision": 2,
+        "min_value": 1,
+        "max_value": 100
+    }
 }
 ```
 """
@@ -257,8 +245,8 @@ You will receive the following information as input;
 **Model JSON Schema:**
 {model_schema_json}
 
-**Generating prompt:**
-{generating_prompt}
+**Generating prompts:**
+{json.dumps(columns_info, indent=2)}
 
 """
     return SYSTEM_PROMPT, PROMPT
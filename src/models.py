@@ -181,6 +181,11 @@ class SMOLLMProducerConfig(BaseModel):
 
     prompt: str = Field(..., description="The prompt of the SMOLLM producer")
 
+    deterministic: Optional[bool] = Field(
+        default=False,
+        description="Whether to decode greedily instead of sampling",
+    )
+
 
 class DateTimeProducerConfig(BaseModel):
     """Model for DateTime producer config."""
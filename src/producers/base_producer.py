@@ -1,6 +1,9 @@
 from abc import ABC, abstractmethod
+import random
 import re
-from typing import Any, Callable
+from typing import Any, Callable, Optional, Union
+
+import numpy as np
 
 from src.models import ColumnDefinition, ColumnProfileDefinition, TableDefinition, TableProfileDefinition
 
@@ -9,14 +12,29 @@ from src.logging_config import get_logger
 
 logger = get_logger()
 
+PLACEHOLDER_RE = re.compile(r"{{.*?}}")
+
 class BaseProducer(ABC):
     """Base producer class."""
 
-   
+    __slots__ = ("_rng", "_np_rng")
+
+    def __init__(self, seed: Optional[Union[int, str]] = None):
+        # Each producer owns its random state so columns can be seeded
+        # independently and generated in parallel without sharing the
+        # module-level generator.
+        self._rng = random.Random(seed)
+        self._np_rng: Optional[np.random.Generator] = None
+
+    def numpy_rng(self) -> np.random.Generator:
+        """Vectorized generator for batch paths, seeded from the producer's own state."""
+        if self._np_rng is None:
+            self._np_rng = np.random.default_rng(self._rng.getrandbits(64))
+        return self._np_rng
 
     def replace_placeholders(self, text: str, context: dict):
         # find all placeholders {{}}
-        placeholders = re.findall(r"{{.*?}}", text)
+        placeholders = PLACEHOLDER_RE.findall(text)
         result = text
 
         for placeholder in placeholders:
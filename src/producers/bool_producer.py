@@ -1,4 +1,5 @@
-import random
+import numpy as np
+
 from src.models import (
     ColumnDefinition,
     ColumnProfileDefinition,
@@ -11,6 +12,8 @@ from src.producers.base_producer import BaseProducer
 class BoolProducer(BaseProducer):
     """Identifier producer class."""
 
+    __slots__ = ()
+
     def generate(
         self,
         table_definition: TableDefinition,
@@ -19,4 +22,9 @@ class BoolProducer(BaseProducer):
         column_profile_definition: ColumnProfileDefinition,
         context: dict,
     ) -> str:
-        return random.random() < 0.5
+        # A single random bit is enough; skips building a 53-bit float
+        return bool(self._rng.getrandbits(1))
+
+    def generate_batch(self, n: int) -> np.ndarray:
+        """Generate n boolean values in one vectorized draw."""
+        return self.numpy_rng().integers(0, 2, size=n, dtype=bool)
@@ -1,11 +1,65 @@
+import itertools
 import random
+from typing import List, Optional, Union
+
 from src.models import ColumnDefinition, ColumnProfileDefinition, TableDefinition, TableProfileDefinition
 from src.producers.base_producer import BaseProducer
 
+# The Bernoulli race is only used for large option lists ...
+BERNOULLI_RACE_THRESHOLD = 64
+# ... whose weights are close to uniform: it needs k * max_weight / sum_weight
+# draws on average, while the cumulative-weight bisect is O(log k) regardless
+BERNOULLI_RACE_MAX_DRAWS = 2
+
+
+class BernoulliRaceSampler:
+    """
+    Exact weighted sampler that does not need a cumulative distribution.
+
+    Picks an option uniformly and accepts it with probability weight/max_weight,
+    which takes k * max_weight / sum_weight draws on average. It is cheap for
+    near-uniform weights and degrades to ~k draws when one option dominates.
+    """
+
+    __slots__ = ("names", "normalized")
+
+    def __init__(self, names: List[str], weights: List[float]):
+        max_weight = max(weights)
+        self.names = names
+        self.normalized = [weight / max_weight for weight in weights]
+
+    def sample(self, rng: random.Random) -> str:
+        names = self.names
+        normalized = self.normalized
+        size = len(names)
+        while True:
+            index = rng.randrange(size)
+            if rng.random() < normalized[index]:
+                return names[index]
+
 
 class ChoiceProducer(BaseProducer):
     """Choice producer class."""
 
+    __slots__ = ("_sampler", "_names", "_cum_weights")
+
+    def __init__(self, seed: Optional[Union[int, str]] = None):
+        super().__init__(seed)
+        self._sampler = None
+        self._names = None
+        self._cum_weights = None
+
+    def _prepare(self, options) -> None:
+        names = [option.name for option in options]
+        weights = [option.probability if option.probability else 1 for option in options]
+
+        expected_draws = len(weights) * max(weights) / sum(weights)
+        if len(options) > BERNOULLI_RACE_THRESHOLD and expected_draws <= BERNOULLI_RACE_MAX_DRAWS:
+            self._sampler = BernoulliRaceSampler(names, weights)
+        else:
+            self._names = names
+            self._cum_weights = list(itertools.accumulate(weights))
+
     def generate(
         self,
         table_definition: TableDefinition,
@@ -14,8 +68,11 @@ class ChoiceProducer(BaseProducer):
         column_profile_definition: ColumnProfileDefinition,
         context: dict,
     ) -> str:
-        
-        # selected_option = random.choice(column_profile_definition.config.options)
-        selected_option = random.choices(column_profile_definition.config.options, weights=[option.probability if option.probability else 1 for option in column_profile_definition.config.options], k=1)[0]
+        # The options of a column never change, so the weights are prepared once per producer
+        if self._sampler is None and self._names is None:
+            self._prepare(column_profile_definition.config.options)
+
+        if self._sampler is not None:
+            return self._sampler.sample(self._rng)
 
-        return selected_option.name
\ No newline at end of file
+        return self._rng.choices(self._names, cum_weights=self._cum_weights, k=1)[0]
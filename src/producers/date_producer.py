@@ -1,5 +1,8 @@
 from datetime import datetime
-import random
+import time
+
+import numpy as np
+
 from src.models import (
     ColumnDefinition,
     ColumnProfileDefinition,
@@ -9,9 +12,34 @@ from src.models import (
 )
 from src.producers.base_producer import BaseProducer
 
+# Default window when the profile does not configure one: the last year
+DEFAULT_RANGE_SECONDS = 365 * 24 * 60 * 60
+
 
 class DateTimeProducer(BaseProducer):
-    """Identifier producer class."""
+    """Datetime producer class."""
+
+    __slots__ = ()
+
+    def get_range(self, column_profile_definition: ColumnProfileDefinition):
+        """Return the (low, high) epoch seconds window for the column."""
+        config = column_profile_definition.config if column_profile_definition else None
+
+        if isinstance(config, DateTimeProducerConfig) and config.start_date and config.end_date:
+            return int(config.start_date.timestamp()), int(config.end_date.timestamp())
+
+        high_ts = int(time.time())
+        return high_ts - DEFAULT_RANGE_SECONDS, high_ts
+
+    def generate_batch(self, n: int, low_ts: int, high_ts: int) -> np.ndarray:
+        """
+        Generate n datetimes in [low_ts, high_ts] as a datetime64[s] array.
+
+        datetime64 carries no timezone: the values are UTC, unlike generate(),
+        which returns naive local datetimes like the configured range.
+        """
+        ts = self.numpy_rng().integers(low_ts, high_ts, size=n, dtype=np.int64, endpoint=True)
+        return ts.view("datetime64[s]")
 
     def generate(
         self,
@@ -20,12 +48,8 @@ class DateTimeProducer(BaseProducer):
         column_definition: ColumnDefinition,
         column_profile_definition: ColumnProfileDefinition,
         context: dict,
-    ) -> str:
-        
-
-        config: DateTimeProducerConfig = column_definition.config
-        
-
-        return datetime.now()
-
+    ) -> datetime:
+        low_ts, high_ts = self.get_range(column_profile_definition)
 
+        # Inclusive, and on the same local-time basis as datetime.timestamp()
+        return datetime.fromtimestamp(self._rng.randint(low_ts, high_ts))
@@ -1,4 +1,3 @@
-import random
 from src.models import ColumnDefinition, ColumnProfileDefinition, TableDefinition, TableProfileDefinition
 from src.producers.base_producer import BaseProducer
 from src.logging_config import get_logger
@@ -8,6 +7,8 @@ logger = get_logger()
 class FKProducer(BaseProducer):
     """FK producer class."""
 
+    __slots__ = ()
+
     def generate(
         self,
         table_definition: TableDefinition,
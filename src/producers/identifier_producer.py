@@ -1,4 +1,5 @@
 import uuid
+from typing import Optional, Union
 from src.models import (
     ColumnDefinition,
     ColumnProfileDefinition,
@@ -11,7 +12,10 @@ from src.producers.base_producer import BaseProducer
 class IdentifierProducer(BaseProducer):
     """Identifier producer class."""
 
-    def __init__(self):
+    __slots__ = ("id_counter",)
+
+    def __init__(self, seed: Optional[Union[int, str]] = None):
+        super().__init__(seed)
         self.id_counter = 0
 
     def generate(
@@ -1,4 +1,3 @@
-import random
 from src.models import (
     ColumnDefinition,
     ColumnProfileDefinition,
@@ -11,6 +10,8 @@ from src.producers.base_producer import BaseProducer
 class OptionsProducer(BaseProducer):
     """Options producer class."""
 
+    __slots__ = ()
+
     def generate(
         self,
         table_definition: TableDefinition,
@@ -48,7 +49,7 @@ class OptionsProducer(BaseProducer):
                 for option in table_profile_configuration.options
                 if option.count is None
             ]
-            selected_option = random.choices(
+            selected_option = self._rng.choices(
                 filtered_list,
                 weights=[
                     option.probability if option.probability else 1
@@ -1,4 +1,4 @@
-from typing import Dict, Type
+from typing import Dict, Optional, Type
 from src.models import (
     ColumnDefinition,
     ColumnProfileDefinition,
@@ -25,7 +25,8 @@ logger = get_logger()
 class ProducerFactory:
     """Factory class for creating and managing producers."""
 
-    def __init__(self):
+    def __init__(self, seed: Optional[int] = None):
+        self._seed = seed
         self._producers: Dict[str, BaseProducer] = {}
         self._producer_types: Dict[str, Type[BaseProducer]] = {
             "identifier": IdentifierProducer,
@@ -66,6 +67,14 @@ class ProducerFactory:
         self._producers[key] = producer
         return producer
 
+    def get_options_producer(self, table_definition: TableDefinition) -> BaseProducer:
+        """Get or create the producer serving a table's predefined options."""
+        key = table_definition.name
+        if key not in self._producers:
+            seed = f"{self._seed}:{key}" if self._seed is not None else None
+            self._producers[key] = self._producer_types["options"](seed=seed)
+        return self._producers[key]
+
     def _create_producer(
         self,
         column_definition: ColumnDefinition,
@@ -73,32 +82,35 @@ class ProducerFactory:
         key: str,
     ) -> BaseProducer:
         """Create a new producer based on column definition and profile."""
+        # Derive a per-column seed so every column gets its own reproducible stream
+        seed = f"{self._seed}:{key}" if self._seed is not None else None
+
         # Check for ID type
 
         if column_definition.foreign_key:
-            return self._producer_types["fk"]()
+            return self._producer_types["fk"](seed=seed)
 
         if column_definition.type == "identifier":
-            return self._producer_types["identifier"]()
+            return self._producer_types["identifier"](seed=seed)
 
         if column_definition.type == "datetime":
-            return self._producer_types["datetime"]()
+            return self._producer_types["datetime"](seed=seed)
 
         if column_definition.type == "numeric":
-            return self._producer_types["numeric"]()
+            return self._producer_types["numeric"](seed=seed)
 
         if column_definition.type == "boolean":
-            return self._producer_types["bool"]()
+            return self._producer_types["bool"](seed=seed)
 
         if profile_configuration and isinstance(
             profile_configuration.config, ChoiceProducerConfig
         ):
-            return self._producer_types["choice"]()
+            return self._producer_types["choice"](seed=seed)
 
         if profile_configuration and isinstance(
             profile_configuration.config, SMOLLMProducerConfig
         ):
-            return self._producer_types["smollm"]()
+            return self._producer_types["smollm"](seed=seed)
 
         logger.debug(f"No suitable producer found for {key}")
         logger.debug(column_definition.model_dump_json())
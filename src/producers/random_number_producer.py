@@ -1,4 +1,3 @@
-import random
 from src.models import (
     ColumnDefinition,
     ColumnProfileDefinition,
@@ -7,11 +6,16 @@ from src.models import (
     TableProfileDefinition,
 )
 from src.producers.base_producer import BaseProducer
+from src.logging_config import get_logger
+
+logger = get_logger()
 
 
 class RandomNumberProducer(BaseProducer):
     """Identifier producer class."""
 
+    __slots__ = ()
+
     def generate(
         self,
         table_definition: TableDefinition,
@@ -25,7 +29,12 @@ class RandomNumberProducer(BaseProducer):
         max = config.max_value if config.max_value else 1
         precision = config.precision if config.precision is not None else 2
 
-        print(f"Generating random number between {min} and {max} with precision {precision}")
-        value = min + (random.random() * (max-min))
+        logger.debug(
+            "Generating random number between %s and %s with precision %s",
+            min,
+            max,
+            precision,
+        )
+        value = min + (self._rng.random() * (max-min))
 
         return round(value, precision)
\ No newline at end of file
@@ -1,7 +1,8 @@
+from collections import deque
 import uuid
 import re
+import threading
 
-from torch._inductor import list_options
 from src.llm import LLMCaller
 from src.models import (
     ColumnDefinition,
@@ -10,48 +11,33 @@ from src.models import (
     TableProfileDefinition,
 )
 from src.producers.base_producer import BaseProducer
-from transformers import AutoModelForCausalLM, AutoTokenizer
 
 from src.logging_config import get_logger
 
 logger = get_logger()
 
+# The local caller is shared by every SMOLLM column and only built on first use,
+# so configurations without generated text never connect to the local backend.
+_llm = None
+_llm_lock = threading.Lock()
 
-class SMOLLMProducer(BaseProducer):
-    """Identifier producer class."""
 
-    def generate(
-        self,
-        table_definition: TableDefinition,
-        table_profile_configuration: TableProfileDefinition,
-        column_definition: ColumnDefinition,
-        column_profile_definition: ColumnProfileDefinition,
-        context: dict,
-    ) -> str:
-        self.llm = LLMCaller(local=True)
-        prompt = self.replace_placeholders(
-            column_profile_definition.config.prompt, context
-        )
+def _get_llm() -> LLMCaller:
+    global _llm
+    if _llm is None:
+        with _llm_lock:
+            if _llm is None:
+                _llm = LLMCaller(local=True)
+    return _llm
 
-        has_dependency = prompt != column_profile_definition.config.prompt
 
-        table_name = table_definition.name
-        column_name = column_definition.name
-        options_key = f"{table_name}.{column_name}.{prompt}"
-
-        if "__options__" not in context:
-            context["__options__"] = {}
-
-        if (
-            options_key not in context["__options__"]
-            or len(context["__options__"][options_key]) == 0
-        ):
-            context["__options__"][options_key] = []
+# Items of a numbered list answer ("1. value"), already trimmed and non-empty.
+# Horizontal whitespace only, so a bare "1." never swallows the next line.
+LIST_ITEM_RE = re.compile(r"^[ \t]*\d+\.[ \t]+(\S(?:.*\S)?)[ \t\r]*$", re.MULTILINE)
 
-        if len(context["__options__"][options_key]) > 0:
-            return context["__options__"][options_key].pop()
-
-        SYSTEM_PROMPT = """You are a strict synthetic data generator for software testing. Your task is to generate mock data for a single spreadsheet cell based on a column description provided by the user.
+# Kept free of per-call values so the prompt prefix is identical on every
+# request and the backend can reuse its cached prefix computation.
+SYSTEM_PROMPT = """You are a strict synthetic data generator for software testing. Your task is to generate mock data for a single spreadsheet cell based on a column description provided by the user.
 
 You must analyze the user input and choose exactly one of two output formats based on the following logic:
 
@@ -104,6 +90,38 @@ Output:
 A large, multinational corporation specializing in advanced technology solutions and cloud infrastructure.
 
 """
+
+
+class SMOLLMProducer(BaseProducer):
+    """Identifier producer class."""
+
+    __slots__ = ()
+
+    def generate(
+        self,
+        table_definition: TableDefinition,
+        table_profile_configuration: TableProfileDefinition,
+        column_definition: ColumnDefinition,
+        column_profile_definition: ColumnProfileDefinition,
+        context: dict,
+    ) -> str:
+        prompt = self.replace_placeholders(
+            column_profile_definition.config.prompt, context
+        )
+
+        has_dependency = prompt != column_profile_definition.config.prompt
+
+        table_name = table_definition.name
+        column_name = column_definition.name
+        options_key = f"{table_name}.{column_name}.{prompt}"
+
+        if "__options__" not in context:
+            context["__options__"] = {}
+
+        options = context["__options__"].get(options_key)
+        if options:
+            return options.popleft()
+
         
         # table length
         table_data = context["__tables__"][table_name]
@@ -113,39 +131,32 @@ A large, multinational corporation specializing in advanced technology solutions
             table_length = 0
 
 
-        SYSTEM_PROMPT += f"Table length: {table_length}"
+        PROMPT = f"""Table length: {table_length}
 
-        print(table_length)
-
-
-        PROMPT = f"""### CURRENT REQUEST
+### CURRENT REQUEST
 
 Input: {prompt} (has_dependency: {has_dependency})
 Output:"""
-        output = self.llm.call(
+        # Greedy decoding (temperature 0) is cheaper and repeatable when variety is not needed
+        temperature = 0 if column_profile_definition.config.deterministic else 1.8
+
+        output = _get_llm().call(
             PROMPT,
             SYSTEM_PROMPT,
-            temperature=1.8,
+            temperature=temperature,
             max_tokens=3000,
             allow_cache=True,
         ).strip()
 
-        print("-" * 100)
-        print(output)
-        print("-" * 100)
+        logger.debug("SMOLLM output for %s.%s: %s", table_name, column_name, output)
 
-        # regex to extract all the items from the numbered list
-        pattern = r"^\d+\.\s+(.*)"
-        matches = re.findall(pattern, output, re.MULTILINE)
+        # extract all the items from the numbered list
+        matches = LIST_ITEM_RE.findall(output)
         if matches:
-            print("-" * 100)
-            print(matches)
-            print("-" * 100)
-            list_of_options = matches
+            logger.debug("Parsed %d options for %s.%s", len(matches), table_name, column_name)
+            # served in the order the model produced them
+            list_of_options = deque(matches)
             context["__options__"][options_key] = list_of_options
-            return list_of_options.pop()
+            return list_of_options.popleft()
         else:
-            print("-" * 100)
-            print(output)
-            print("-" * 100)
             return output
\ No newline at end of file
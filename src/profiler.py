@@ -1,4 +1,6 @@
+from concurrent.futures import ThreadPoolExecutor
 import json
+import logging
 import re
 from src.hierarchy import Hierarchy
 from src.llm import LLMCaller
@@ -6,7 +8,8 @@ from src.llm.prompts import (
     get_column_descriptions_prompt,
     get_profiler_prompt,
     get_static_data_generation_prompt,
-    get_configuration_for_column,
+    get_configuration_for_columns,
+    heal_dynamic_response_table,
 )
 
 from src.models import (
@@ -19,28 +22,37 @@ from src.models import (
     TableOptions,
     TableProfileDefinition,
 )
-from src.utils import extract_nested_json, table_logger, bcolors
+from src.utils import parse_llm_json, table_logger, bcolors
 from src.logging_config import get_logger
 
 logger = get_logger()
 
 
 class Profiler:
-    def __init__(self, configuration: Configuration, hierarchy: Hierarchy):
+    def __init__(
+        self, configuration: Configuration, hierarchy: Hierarchy, max_workers: int = 8
+    ):
         self.hierarchy = hierarchy
         self.configuration = configuration
 
+        self._tables_by_name = {table.name: table for table in configuration.tables}
+        self._schema_cache: dict[str, str] = {}
+
         self.llm = LLMCaller(local=False)
 
+        # The per-table LLM calls are independent, so they are dispatched concurrently
+        self.max_workers = max_workers
+
     def get_table(self, table_name: str):
-        return next(
-            (table for table in self.configuration.tables if table.name == table_name),
-            None,
-        )
+        return self._tables_by_name.get(table_name)
 
     def get_schema(self, table_name: str):
-        table = self.get_table(table_name)
-        return json.dumps(table.model_dump()["columns"], indent=2)
+        schema = self._schema_cache.get(table_name)
+        if schema is None:
+            table = self.get_table(table_name)
+            schema = json.dumps(table.model_dump()["columns"], indent=2)
+            self._schema_cache[table_name] = schema
+        return schema
 
     def get_table_type(self, table_name: str):
         schema = self.get_schema(table_name)
@@ -52,6 +64,81 @@ class Profiler:
             prompt, system_prompt, temperature=0, max_tokens=3000
         ).strip()
 
+    def _parse_llm_json(self, text: str):
+        """Parse an LLM answer, asking the LLM to repair it only if parsing fails."""
+        parsed = parse_llm_json(text)
+        if parsed is None:
+            system_prompt, prompt = heal_dynamic_response_table(text)
+            healed = self.llm.call(
+                prompt, system_prompt, temperature=0, max_tokens=3000
+            ).strip()
+            parsed = parse_llm_json(healed)
+        return parsed
+
+    def _configure_numeric_columns(self, numeric_prompts: dict) -> dict:
+        """Request numeric configurations keyed by column name; {} if the answer is not an object."""
+        system_prompt, prompt = get_configuration_for_columns(
+            numeric_prompts,
+            NumericType.model_json_schema(),
+        )
+        column_configuration_output = self.llm.call(
+            prompt, system_prompt, temperature=0, max_tokens=3000
+        ).strip()
+        column_configs = self._parse_llm_json(column_configuration_output)
+        return column_configs if isinstance(column_configs, dict) else {}
+
+    def _classify_table(self, table_name: str) -> dict:
+        table_type = self._parse_llm_json(self.get_table_type(table_name))
+
+        if isinstance(table_type, dict):
+            return table_type
+
+        return {
+            "classification": "DYNAMIC",
+            "count": 5,
+            "confidence": 0.0,
+            "reasoning": "Error parsing table type",
+        }
+
+    def _describe_table(
+        self, table_name: str, dependent_tables_schema: str, table_types: dict
+    ):
+        table_schema = self.get_schema(table_name)
+
+        table_type = table_types[table_name]
+
+        is_static = table_type["classification"] == "STATIC"
+
+        column_description = ""
+
+        if is_static:
+            system_prompt, prompt = get_static_data_generation_prompt(
+                self.configuration.product_description,
+                table_name,
+                table_schema,
+            )
+
+            column_description = self.llm.call(
+                prompt, system_prompt, temperature=0, max_tokens=6000
+            ).strip()
+        else:
+            system_prompt, prompt = get_column_descriptions_prompt(
+                self.configuration.product_description,
+                table_name,
+                table_schema,
+                dependent_tables_schema,
+            )
+
+            column_description = self.llm.call(
+                prompt, system_prompt, temperature=0, max_tokens=3000
+            ).strip()
+
+        column_description_json = self._parse_llm_json(column_description)
+        if column_description_json is None:
+            logger.error(f"Error parsing column {table_name}")
+            return {"error": f"Error parsing column {table_name}"}
+        return column_description_json
+
     def build_profile(self):
         logger.info("-" * 60)
         logger.info("\033[94mBuilding profile...\033[0m")
@@ -60,101 +147,78 @@ class Profiler:
 
         hierarchy = self.hierarchy.process_hierarchy(tables, dependency_tree)
 
+        # Serialize every schema and dependency block once up front;
+        # the worker threads only read them
+        schemas = {table_name: self.get_schema(table_name) for table_name in tables}
+        dependent_schemas = {
+            table_name: "\n".join(
+                schemas[dependency]
+                for dependency in hierarchy[table_name]["depends_on"]
+            )
+            for table_name in tables
+        }
+
         for hierarchy_table in hierarchy:
             dependencies_str = ", ".join(hierarchy[hierarchy_table]["depends_on"])
             logger.info(
                 f"{bcolors.HEADER} * {hierarchy_table} ({len(hierarchy[hierarchy_table]['depends_on'])}){bcolors.ENDC} {bcolors.OKCYAN}{': [' + dependencies_str + ' ]' if len(dependencies_str) > 0 else ''}{bcolors.ENDC}"
             )
 
-        table_types = {}
-
         table_options = {}
 
+        # Column prompts of the dynamic tables keyed by (table, column)
+        column_prompts = {}
+
         logger.info("-" * 60)
         logger.info("\033[94mEvaluating if tables are static or dynamic...\033[0m")
-        for table_name in tables:
-            table_type = self.get_table_type(table_name)
-
-            try:
-                table_type = json.loads(table_type.split("```json")[1].split("```")[0])
-            except Exception as e:
-                table_type = {
-                    "classification": "DYNAMIC",
-                    "count": 5,
-                    "confidence": 0.0,
-                    "reasoning": "Error parsing table type",
-                }
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            table_types = dict(zip(tables, executor.map(self._classify_table, tables)))
+
+        for table_name, table_type in table_types.items():
             logger.info(
                 f"{bcolors.HEADER} + {((table_name+"("+str(table_type['count'])+")").center(30))}[ {table_type['classification'].center(10)} ] {bcolors.ENDC}"
             )
 
-            table_types[table_name] = table_type
-
         logger.info("-" * 60)
         logger.info(f"{bcolors.OKBLUE}Generating column descriptions ...{bcolors.ENDC}")
-        for table_name in tables:
-            table_schema = self.get_schema(table_name)
-            dependent_tables = hierarchy[table_name]["depends_on"]
-            dependent_tables_schema = [
-                self.get_schema(table) for table in dependent_tables
-            ]
-
-            dependent_tables_schema = "\n".join(dependent_tables_schema)
-
-            table_type = table_types[table_name]
-
-            is_static = table_type["classification"] == "STATIC"
-
-            column_description = ""
-
-            if is_static:
-                system_prompt, prompt = get_static_data_generation_prompt(
-                    self.configuration.product_description,
-                    table_name,
-                    table_schema,
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            column_descriptions = list(
+                executor.map(
+                    lambda table_name: self._describe_table(
+                        table_name, dependent_schemas[table_name], table_types
+                    ),
+                    tables,
                 )
+            )
 
-                column_description = self.llm.call(
-                    prompt, system_prompt, temperature=0, max_tokens=6000
-                ).strip()
-            else:
-                system_prompt, prompt = get_column_descriptions_prompt(
-                    self.configuration.product_description,
-                    table_name,
-                    table_schema,
-                    dependent_tables_schema,
-                )
-
-                column_description = self.llm.call(
-                    prompt, system_prompt, temperature=0, max_tokens=3000
-                ).strip()
-
-            column_description_json = None
-
-            try:
-                column_description_json = extract_nested_json(column_description, True)
-            except Exception as e:
-                print(f"Error parsing column {table_name}: {e}")
-                column_description_json = {"error": "Error parsing column {table_name}"}
-            if isinstance(column_description_json, list):
-                table_logger(column_description_json, table_name)
-            else:
-                logger.info("-" * 80)
-                logger.info(
-                    f"{bcolors.HEADER} {table_name} generation prompts... {bcolors.ENDC}"
-                )
-                for key, value in column_description_json.items():
-                    replace_regex = r"(\{\{[a-zA-Z0-9_. ]+\}\})"
-                    print_value = str(value).replace(
-                        replace_regex,
-                        rf"{bcolors.OKGREEN}$1{bcolors.ENDC}{bcolors.WARNING}",
-                    )
-                    logger.info(
-                        f"{bcolors.HEADER} | {key[:20].center(20)}{bcolors.ENDC} | {bcolors.WARNING}{print_value}{bcolors.ENDC} "
-                    )
-                logger.info("-" * 80)
+        for table_name, column_description_json in zip(tables, column_descriptions):
+            # Each table is emitted as a single log record, rendered only when INFO is on
+            if logger.isEnabledFor(logging.INFO):
+                if isinstance(column_description_json, list):
+                    rendered = table_logger(column_description_json, table_name, extra_space=True)
+                    if rendered:
+                        logger.info(rendered.rstrip("\n"))
+                else:
+                    lines = [
+                        "-" * 80,
+                        f"{bcolors.HEADER} {table_name} generation prompts... {bcolors.ENDC}",
+                    ]
+                    for key, value in column_description_json.items():
+                        replace_regex = r"(\{\{[a-zA-Z0-9_. ]+\}\})"
+                        print_value = str(value).replace(
+                            replace_regex,
+                            rf"{bcolors.OKGREEN}$1{bcolors.ENDC}{bcolors.WARNING}",
+                        )
+                        lines.append(
+                            f"{bcolors.HEADER} | {key[:20].center(20)}{bcolors.ENDC} | {bcolors.WARNING}{print_value}{bcolors.ENDC} "
+                        )
+                    lines.append("-" * 80)
+                    logger.info("\n".join(lines))
             if column_description_json:
                 table_options[table_name] = column_description_json
+                if isinstance(column_description_json, dict):
+                    for column_name, column_prompt in column_description_json.items():
+                        column_prompts[(table_name, column_name)] = column_prompt
 
         logger.info("#" * 60)
         logger.info(f"{bcolors.OKBLUE}Completing profile ...{bcolors.ENDC}")
@@ -201,28 +265,36 @@ class Profiler:
                     options=None,
                 )
 
+                # One request configures every numeric column of the table
+                numeric_prompts = {
+                    column.name: column_prompts[(table_name, column.name)]
+                    for column in table.columns
+                    if not column.foreign_key and column.type == "numeric"
+                }
+                column_configs = (
+                    self._configure_numeric_columns(numeric_prompts)
+                    if numeric_prompts
+                    else {}
+                )
+                # Columns the batched answer left out are requested one by one
+                for column_name, column_prompt in numeric_prompts.items():
+                    if column_name not in column_configs:
+                        retry = self._configure_numeric_columns(
+                            {column_name: column_prompt}
+                        )
+                        if column_name in retry:
+                            column_configs[column_name] = retry[column_name]
+
                 for column in table.columns:
                     column_profile_definition = None
 
                     if not column.foreign_key:
                         if column.type == "numeric":
-                            schema_json = NumericType.model_json_schema()
-                            system_prompt, prompt = get_configuration_for_column(
-                                table_options[table_name][column.name],
-                                schema_json,
-                            )
-                            column_configuration_output = self.llm.call(
-                                prompt, system_prompt, temperature=0, max_tokens=3000
-                            ).strip()
                             try:
-                                column_configuration_json = extract_nested_json(
-                                    column_configuration_output, True
-                                )
-
                                 column_profile_definition = ColumnProfileDefinition(
                                     producer="numeric",
                                     config=RandomNumberProducerConfig(
-                                        **column_configuration_json
+                                        **column_configs[column.name]
                                     ),
                                 )
 
@@ -230,7 +302,7 @@ class Profiler:
                                 logger.error(
                                     f"Unable to generate the configuration for {table_name}.{column.name}"
                                 )
-                                logger.error(column_configuration_json)
+                                logger.error(column_configs.get(column.name))
                                 raise e
 
                         elif column.type == "string":
@@ -238,7 +310,7 @@ class Profiler:
                                 producer="smollm",
                                 config=SMOLLMProducerConfig(
                                     list=False,
-                                    prompt=table_options[table_name][column.name],
+                                    prompt=column_prompts[(table_name, column.name)],
                                 ),
                             )
 
@@ -248,8 +320,8 @@ class Profiler:
                         )
                         continue
 
-                    column_profile_definition.root_prompt = table_options[table_name][
-                        column.name
+                    column_profile_definition.root_prompt = column_prompts[
+                        (table_name, column.name)
                     ]
 
                     column_profile_definitions[column.name] = column_profile_definition
@@ -1,19 +1,79 @@
-from typing import Any
+import functools
+from itertools import zip_longest
+from operator import itemgetter
+from types import SimpleNamespace
+from typing import Any, Union
 from src.logging_config import get_logger
 import json
+import re
 logger = get_logger()
 
+# orjson is optional; it only speeds up decoding of large LLM answers
+try:
+    import orjson
 
-class bcolors:
-    HEADER = "\033[95m"
-    OKBLUE = "\033[94m"
-    OKCYAN = "\033[96m"
-    OKGREEN = "\033[92m"
-    WARNING = "\033[93m"
-    FAIL = "\033[91m"
-    ENDC = "\033[0m"
-    BOLD = "\033[1m"
-    UNDERLINE = "\033[4m"
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
+# Line breaks flattened to spaces in a single pass when ellipsis is requested
+_ELLIPSIS_TRANS = str.maketrans({"\n": " ", "\r": " "})
+
+# A fenced ```json block wrapping a single object or array
+FENCE_RE = re.compile(r"```(?:json)?\s*(\{.*?\}|\[.*?\])\s*```", re.S)
+
+# First opening delimiter of a JSON object or array
+_START_RE = re.compile(r"[\[{]")
+
+# Byte-level counterparts used when the payload has not been decoded yet
+_START_RE_B = re.compile(rb"[\[{]")
+_BRACES_RE_B = re.compile(rb'"(?:[^"\\]|\\.)*"|[{}]', re.S)
+_BRACKETS_RE_B = re.compile(rb'"(?:[^"\\]|\\.)*"|[\[\]]', re.S)
+
+# Parses one JSON value from an offset and reports where it ended
+_raw_decode = json.JSONDecoder().raw_decode
+
+# Structural scanners for extract_nested_json. String literals (with escapes)
+# are matched as whole tokens so delimiters inside them are never counted.
+_BRACES_RE = re.compile(r'"(?:[^"\\]|\\.)*"|[{}]', re.S)
+_BRACKETS_RE = re.compile(r'"(?:[^"\\]|\\.)*"|[\[\]]', re.S)
+
+
+# ANSI escape codes; a plain namespace so lookups skip the class machinery
+bcolors = SimpleNamespace(
+    HEADER="\033[95m",
+    OKBLUE="\033[94m",
+    OKCYAN="\033[96m",
+    OKGREEN="\033[92m",
+    WARNING="\033[93m",
+    FAIL="\033[91m",
+    ENDC="\033[0m",
+    BOLD="\033[1m",
+    UNDERLINE="\033[4m",
+)
+
+
+def _chunks(value: str, width: int) -> tuple:
+    """Split value into width-sized pieces; short values are returned whole."""
+    if width is None or len(value) <= width:
+        return (value,)
+    return tuple(value[i : i + width] for i in range(0, len(value), width))
+
+
+@functools.lru_cache(maxsize=64)
+def _header_block(header: tuple, widths: tuple) -> tuple:
+    """
+    Return the separator line and the framed column-label block for a layout.
+
+    Both depend only on the column names and widths, so tables repeatedly
+    logged with the same schema reuse them.
+    """
+    # The same separator frames the header and closes the table
+    sep_line = "|-" + "-+-".join("-" * (width + 2) for width in widths) + "-|\n"
+    labels = " | ".join(
+        f"{str(key[:width]):^{width + 2}}" for key, width in zip(header, widths)
+    )
+    return sep_line, f"{sep_line}| {labels} |\n{sep_line}"
 
 
 def table_logger(
@@ -30,10 +90,12 @@ def table_logger(
     """
     max_widths = {}
 
-    result = ""
+    # Lines are collected and joined once instead of growing a string
+    parts = []
+    append = parts.append
 
     if extra_space:
-        result += "\n"
+        append("\n")
 
     if isinstance(obj, dict):
         obj = [obj]
@@ -42,24 +104,18 @@ def table_logger(
         get_first_item = obj[0]
         header = list(get_first_item.keys())
 
-        # Prepare max widths for each column (before applying max_column_width)
-        for key in header:
-            max_widths[key] = max(len(str(get_first_item[key])), max_widths.get(key, 0))
-
-        for row in obj:
-            for key in header:
-                value_str = str(row[key])
-                # For multiline, consider longest split part
-                if max_column_width is not None:
-                    split_lines = [
-                        value_str[i : i + max_column_width]
-                        for i in range(0, len(value_str), max_column_width)
-                    ]
-                    max_line_len = max((len(line) for line in split_lines), default=0)
-                    cell_width = max_line_len
-                else:
-                    cell_width = len(value_str)
-                max_widths[key] = max(cell_width, max_widths.get(key, 0), len(str(key)))
+        # Stringify every cell once; the render pass reuses these strings.
+        # The widest chunk of a split cell is min(len, max_column_width), so
+        # clamping the column maximum afterwards gives the same width as
+        # measuring every chunk.
+        if len(header) > 1:
+            # itemgetter projects each row onto the header in one C call
+            str_rows = [tuple(map(str, values)) for values in map(itemgetter(*header), obj)]
+        else:
+            # itemgetter returns a bare value (or fails) for fewer than two keys
+            str_rows = [tuple(str(row[key]) for key in header) for row in obj]
+        for key, column in zip(header, zip(*str_rows)):
+            max_widths[key] = max(max(map(len, column)), len(str(key)))
 
         # apply max_column_width restriction to width, but never less than header length
         if max_column_width is not None:
@@ -67,123 +123,128 @@ def table_logger(
                 max_widths[key] = max(min(max_widths[key], max_column_width), len(str(key)))
 
         total_width = sum(max_widths.values()) + 5 * len(header) - 1
+        widths = tuple(max_widths[key] for key in header)
+        sep_line, header_block = _header_block(tuple(header), widths)
 
         if table_header:
-            result += "|" + "-" * total_width + "|\n"
-            result += "|" + str(table_header[:total_width]).center(total_width) + "|\n"
-
-        result += "|-" + "-+-".join("-" * (max_widths[key] + 2) for key in header) + "-|\n"
-
-        # Render the header
-        result += (
-            "| "
-            + " | ".join(
-                str(key[: max_widths[key]]).center(max_widths[key] + 2)
-                for key in header
-            )
-            + " |\n"
-        )
+            append("|" + "-" * total_width + "|\n")
+            append(f"|{str(table_header[:total_width]):^{total_width}}|\n")
 
-        result += "|-" + "-+-".join("-" * (max_widths[key] + 2) for key in header) + "-|\n"
+        append(header_block)
 
         # Render the table body with multiline cells
-        for row in obj:
-            # For each key, split contents if needed
+        pad_widths = [width + 2 for width in widths]
+        for str_row in str_rows:
+            # For each cell, split contents if needed
             cell_lines = []
-            max_lines = 1
-            for key in header:
-                value = str(row[key])
-                # if ellipsis is true then replace \n with ...
-                if ellipsis and "\n" in value:
-                    value = value.replace("\n", " ")
-                if ellipsis and len(value) > max_column_width:
-                    value = value[:max_column_width-3] + "..."
-                if max_column_width is not None and len(value) > max_column_width:
-                    lines = [
-                        value[i : i + max_column_width]
-                        for i in range(0, len(value), max_column_width)
-                    ]
-                else:
-                    lines = [value]
-                cell_lines.append(lines)
-                if len(lines) > max_lines:
-                    max_lines = len(lines)
-            # For each line in row (for multiline cells)
-            for line_no in range(max_lines):
-                row_str = "| "
-                for col, lines in enumerate(cell_lines):
-                    cell = lines[line_no] if line_no < len(lines) else ""
-                    pad_width = max_widths[header[col]] + 2
-                    row_str += cell.center(pad_width)
-                    if col != len(cell_lines) - 1:
-                        row_str += " | "
-                    else:
-                        row_str += " |\n"
-                result += row_str
-        result += "|-" + "-+-".join("-" * (max_widths[key] + 2) for key in header) + "-|\n"
+            for value in str_row:
+                # if ellipsis is true then flatten line breaks and truncate with ...
+                if ellipsis:
+                    value = value.translate(_ELLIPSIS_TRANS)
+                    if len(value) > max_column_width:
+                        value = f"{value[:max_column_width-3]}..."
+                cell_lines.append(_chunks(value, max_column_width))
+            # Rows whose cells all fit on one line (every cell of a typical
+            # single-row table) are emitted directly
+            if all(len(lines) == 1 for lines in cell_lines):
+                cells = [f"{lines[0]:^{pad}}" for lines, pad in zip(cell_lines, pad_widths)]
+                append("| " + " | ".join(cells) + " |\n")
+                continue
+            # For each line in row (for multiline cells), shorter cells padded with ""
+            for line in zip_longest(*cell_lines, fillvalue=""):
+                cells = [f"{cell:^{pad}}" for cell, pad in zip(line, pad_widths)]
+                append("| " + " | ".join(cells) + " |\n")
+        append(sep_line)
+
+        return "".join(parts)
 
-        return result
-        
 
-    
+def _extract_nested_json_bytes(buf, convert_to_json: bool = False):
+    """Byte-level extract_nested_json, scanning the buffer without decoding it."""
+    match = _START_RE_B.search(buf)
+    if match is None:
+        return None
+
+    start_index = match.start()
+    if match.group() == b"{":
+        scanner, open_token, close_token = _BRACES_RE_B, b"{", b"}"
+    else:
+        scanner, open_token, close_token = _BRACKETS_RE_B, b"[", b"]"
 
+    depth = 1
+    for match in scanner.finditer(buf, start_index + 1):
+        token = match.group()
+        if token == open_token:
+            depth += 1
+        elif token == close_token:
+            depth -= 1
+            if depth == 0:
+                payload = bytes(buf[start_index : match.end()])
+                return _json_loads(payload) if convert_to_json else payload
+    # Unbalanced JSON object or array
+    return None
 
-def extract_nested_json(text: str, convert_to_json: bool = False):
+
+def extract_nested_json(text: Union[str, bytes, bytearray, memoryview], convert_to_json: bool = False):
     """
     Extracts a single, complete, and correctly nested JSON object or array from a string.
 
     Args:
-        text: The input string containing text and a JSON object or array.
+        text: The input string containing text and a JSON object or array. Bytes-like
+            input is scanned as-is and the extracted JSON is returned as bytes.
         convert_to_json: If True, the extracted JSON string will be converted to a JSON object.
     Returns:
         The extracted JSON string, or None if no valid start is found.
     """
-    brace_count = 0
-    bracket_count = 0
-    start_index = -1
-    is_object = False
-    is_array = False
-
-    # Find the first non-whitespace occurrence of '{' or '['
-    for i, char in enumerate(text):
-        if char == '{':
-            start_index = i
-            is_object = True
-            brace_count = 1
-            break
-        elif char == '[':
-            start_index = i
-            is_array = True
-            bracket_count = 1
-            break
-
-    if start_index == -1:
+    if isinstance(text, (bytes, bytearray, memoryview)):
+        return _extract_nested_json_bytes(text, convert_to_json)
+
+    # Find the first occurrence of '{' or '['
+    match = _START_RE.search(text)
+    if match is None:
         return None  # No starting brace/bracket found
 
+    start_index = match.start()
+
+    # Well-formed JSON is parsed and delimited in a single C pass; only
+    # malformed payloads fall through to the delimiter scan below.
+    try:
+        obj, end_index = _raw_decode(text, start_index)
+    except ValueError:
+        pass
+    else:
+        return obj if convert_to_json else text[start_index:end_index]
+
+    is_object = text[start_index] == '{'
+    brace_count = 1
+    bracket_count = 1
+
     if is_object:
-        # Iterate from the starting '{'
-        for i in range(start_index + 1, len(text)):
-            ch = text[i]
-            if ch == '{':
+        # Walk only the braces and string literals, located by a C-level regex scan
+        for match in _BRACES_RE.finditer(text, start_index + 1):
+            token = match.group()
+            if token == '{':
                 brace_count += 1
-            elif ch == '}':
+            elif token == '}':
                 brace_count -= 1
                 if brace_count == 0:
+                    i = match.start()
                     if convert_to_json:
                         return json.loads(text[start_index : i + 1])
                     else:
                         return text[start_index : i + 1]
         # If loop finishes without brace_count reaching zero (unbalanced JSON object)
         return None
-    elif is_array:
-        # Iterate from the starting '['
-        for i in range(start_index + 1, len(text)):
-            ch = text[i]
-            if ch == '[':
+    else:
+        # Walk only the brackets and string literals, located by a C-level regex scan
+        for match in _BRACKETS_RE.finditer(text, start_index + 1):
+            token = match.group()
+            if token == '[':
                 bracket_count += 1
-            elif ch == ']':
+            elif token == ']':
                 bracket_count -= 1
                 if bracket_count == 0:
+                    i = match.start()
                     if convert_to_json:
                         return json.loads(text[start_index : i + 1])
                     else:
@@ -191,4 +252,25 @@ def extract_nested_json(text: str, convert_to_json: bool = False):
         # If loop finishes without bracket_count reaching zero (unbalanced JSON array)
         return None
 
-    return None  # fallback, should not reach here
\ No newline at end of file
+
+def parse_llm_json(text: str):
+    """
+    Parse the JSON payload of an LLM answer.
+
+    Tries the fenced ```json block first, then falls back to the first balanced
+    object or array in the text.
+
+    Returns:
+        The parsed JSON value, or None if nothing in the text parses.
+    """
+    match = FENCE_RE.search(text)
+    if match:
+        try:
+            return _json_loads(match.group(1))
+        except ValueError:
+            pass
+
+    try:
+        return extract_nested_json(text, True)
+    except ValueError:
+        return None